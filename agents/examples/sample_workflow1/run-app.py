@@ -9,8 +9,15 @@ for determining a deployed workflow application are AGENT_STUDIO_RENDER_MODE and
 APP_DATA_DIR.
 """
 
-import subprocess
+import logging
 import os
+import subprocess
+
+logging.basicConfig(
+    level=os.getenv("LOGLEVEL", "INFO").upper(),
+    format="%(asctime)s %(levelname)s %(name)s %(message)s",
+)
+log = logging.getLogger("agent_studio")
 
 def initialize_app_paths():
     app_dir = None
@@ -32,10 +39,16 @@ def initialize_app_paths():
     os.environ["APP_DIR"] = app_dir
     os.environ["APP_DATA_DIR"] = app_data_dir
 
-    print(f"Application directory: {app_dir}")
-    print(f"Application data directory: {app_data_dir}")
+    log.info("Application directory: %s", app_dir)
+    log.info("Application data directory: %s", app_data_dir)
 
 initialize_app_paths()
 
-out = subprocess.run([f"bash {os.getenv('APP_DIR')}/bin/start-app-script.sh"], shell=True, check=True)
-print("Application complete.")
+app_dir = os.getenv("APP_DIR")
+if not app_dir:
+    raise RuntimeError("APP_DIR is not set; cannot locate bin/start-app-script.sh")
+
+# Run the start script as a child rather than exec'ing it: this file may run
+# inside a CML/IPython kernel, which must keep running.
+subprocess.run(["bash", os.path.join(app_dir, "bin", "start-app-script.sh")], check=True)
+log.info("Application complete.")
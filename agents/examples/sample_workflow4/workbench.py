@@ -2,33 +2,40 @@
 
 import os
 import sys
+import logging
 import subprocess
+import importlib.util
 
 # Set UV_LINK_MODE to copy to avoid hardlinking issues on filesystems with link limits
 os.environ["UV_LINK_MODE"] = "copy"
 
 # Restore the original stdio file objects so the
-# jupyter kernel doesn't swallow our print statements
+# jupyter kernel doesn't swallow our log output
 sys.stdout = sys.__stdout__
 sys.stderr = sys.__stderr__
 
+logging.basicConfig(
+    level=os.getenv("LOGLEVEL", "INFO").upper(),
+    format="%(asctime)s %(levelname)s %(name)s %(message)s",
+)
+log = logging.getLogger("agent_studio")
+
 # Configure virtual environment if in runtime mode
 if os.getenv("AGENT_STUDIO_DEPLOY_MODE", "amp").lower() == "runtime":
     app_dir = os.getenv("APP_DIR")
     venv_path = os.path.join(app_dir, "studio", "workflow_engine", ".venv")
-    print(f"venv_path----------: {venv_path}")
+    log.debug("venv_path: %s", venv_path)
     if os.path.exists(venv_path):
         os.environ["VIRTUAL_ENV"] = venv_path
         os.environ["PATH"] = f"{venv_path}/bin:{os.environ.get('PATH', '')}"
-        # Add site-packages for common Python versions
-        python_versions = ["python3.10", "python3.11", "python3.9"]
-        for py_version in python_versions:
-            site_packages = os.path.join(venv_path, "lib", py_version, "site-packages")
-            if os.path.exists(site_packages) and site_packages not in sys.path:
-                sys.path.insert(0, site_packages)
-                print(f"Added {py_version} site-packages to sys.path: {site_packages}")
-                break
-        print(f"Configured virtual environment: {venv_path}")
+        # Add the venv's site-packages for the running interpreter's version; packages
+        # built for any other version would not be importable from this kernel anyway.
+        py_version = f"python{sys.version_info.major}.{sys.version_info.minor}"
+        site_packages = os.path.join(venv_path, "lib", py_version, "site-packages")
+        if site_packages not in sys.path and os.path.isdir(site_packages):
+            sys.path.insert(0, site_packages)
+            log.info("Added %s site-packages to sys.path: %s", py_version, site_packages)
+        log.info("Configured virtual environment: %s", venv_path)
 
 
 # Extract workflow parameters from the environment
@@ -51,8 +58,22 @@ if os.getenv("AGENT_STUDIO_DEPLOY_MODE", "amp").lower() == "runtime":
 # and ops modules that are used in a workflow.
 from engine.utils import get_url_scheme
 
-scheme = get_url_scheme()
-subprocess.call(["pip", "install", f"{scheme}://{CDSW_DOMAIN}/api/v2/python.tar.gz"])
+# Skip the install on warm starts where cmlapi is already importable.
+if importlib.util.find_spec("cmlapi") is None:
+    scheme = get_url_scheme()
+    try:
+        subprocess.check_call(
+            [
+                sys.executable,
+                "-m",
+                "pip",
+                "install",
+                "--disable-pip-version-check",
+                f"{scheme}://{CDSW_DOMAIN}/api/v2/python.tar.gz",
+            ]
+        )
+    except subprocess.CalledProcessError as e:
+        log.warning("Failed to install cmlapi: %s", e)
 
 # If we are in old workbenches, we cannot modify the model
 # root dir location. To get around this, we specify early what
@@ -60,7 +81,7 @@ subprocess.call(["pip", "install", f"{scheme}://{CDSW_DOMAIN}/api/v2/python.tar.
 # early change our directory. This script runs in a python
 # kernel so all commands after this will run in the kernel.
 # also ensure the workflow engine code is on the path.
-print(f"Model execution directory: {MODEL_EXECUTION_DIR}")
+log.info("Model execution directory: %s", MODEL_EXECUTION_DIR)
 os.chdir(MODEL_EXECUTION_DIR)
 sys.path.append(os.path.join("src/"))
 
@@ -72,8 +93,8 @@ import asyncio
 from opentelemetry.context import get_current
 from datetime import datetime
 from typing import List, Dict, Union, Optional
-import json
 import base64
+import orjson
 from pydantic import BaseModel
 
 import engine.types as input_types
@@ -92,11 +113,18 @@ extract_artifact_to_location(WORFKLOW_ARTIFACT, WORKFLOW_DIRECTORY)
 LANGGRAPH_CALLABLES = None
 tracer = None  # keep this for CrewAI workflows
 
+# Asset URI -> tool instance / agent, used to validate GET_ASSET_DATA requests.
+# The collated input is fixed for the lifetime of the process, so build these once.
+_tool_instances_by_image_uri: Dict[str, BaseModel] = {}
+_agents_by_image_uri: Dict[str, BaseModel] = {}
+
 if is_langgraph_workflow(WORKFLOW_DIRECTORY):
     LANGGRAPH_CALLABLES = load_langgraph_workflow(WORKFLOW_DIRECTORY)
 elif is_crewai_workflow(WORKFLOW_DIRECTORY):
     collated_input: Optional[BaseModel] = None
     collated_input, tracer = load_crewai_workflow(WORKFLOW_DIRECTORY)
+    _tool_instances_by_image_uri = {tool.tool_image_uri: tool for tool in collated_input.tool_instances}
+    _agents_by_image_uri = {agent.agent_image_uri: agent for agent in collated_input.agents}
 else:
     raise ValueError("Unsupported workflow artifact type.")
 
@@ -106,24 +134,39 @@ workflow_name = get_workflow_name(workflow_dir=WORKFLOW_DIRECTORY)
 
 _mcp_tool_defintions: Optional[Dict[str, List[Dict]]] = None
 
+# The deployment config (API keys, env vars, etc.) is fixed for the lifetime of
+# the deployed model, so parse and validate it once rather than on every request.
+_DEPLOYMENT_CONFIG: input_types.DeploymentConfig = input_types.DeploymentConfig.model_validate(
+    orjson.loads(WORKFLOW_DEPLOYMENT_CONFIG)
+)
+
 
 async def _set_mcp_tool_definitions():
     global _mcp_tool_defintions
     if not LANGGRAPH_CALLABLES:
-        deployment_config: input_types.DeploymentConfig = input_types.DeploymentConfig.model_validate(
-            json.loads(WORKFLOW_DEPLOYMENT_CONFIG)
-        )
+        deployment_config = _DEPLOYMENT_CONFIG
         result = await get_mcp_tools_definitions(collated_input.mcp_instances, deployment_config.mcp_config)
         _mcp_tool_defintions = {mcp_id: [t.model_dump() for t in tool_list] for mcp_id, tool_list in result.items()}
-        print(f"MCP tool definitions are set")
+        log.info("MCP tool definitions are set")
 
 
 asyncio.create_task(_set_mcp_tool_definitions())
 
 
+def _base64_encode_file(path: str, chunk_size: int = 1 << 20) -> str:
+    # Encode in 3-byte-aligned chunks so the raw file is never held in memory
+    # alongside its encoding; the concatenated chunks equal a one-shot encode.
+    chunk_size -= chunk_size % 3
+    encoded = bytearray()
+    with open(path, "rb") as asset_file:
+        while chunk := asset_file.read(chunk_size):
+            encoded += base64.b64encode(chunk)
+    return encoded.decode()
+
+
 def base64_decode(encoded_str: str):
-    decoded_bytes = base64.b64decode(encoded_str)
-    return json.loads(decoded_bytes.decode("utf-8"))
+    # orjson parses the decoded bytes directly, skipping an intermediate str
+    return orjson.loads(base64.b64decode(encoded_str))
 
 
 # TODO: remove dependence on collated_input workflow type
@@ -131,17 +174,10 @@ def base64_decode(encoded_str: str):
 def api_wrapper(args: Union[dict, str]) -> str:
     dict_args = args
     if not isinstance(args, dict):
-        dict_args = json.loads(args)
+        dict_args = orjson.loads(args)
     serve_workflow_parameters = input_types.ServeWorkflowParameters.model_validate(dict_args)
     if serve_workflow_parameters.action_type == input_types.DeployedWorkflowActions.KICKOFF.value:
-        inputs = (
-            base64_decode(serve_workflow_parameters.kickoff_inputs) if serve_workflow_parameters.kickoff_inputs else {}
-        )
-
-        # Extract deployment config (API keys, env vars, etc.)
-        deployment_config: input_types.DeploymentConfig = input_types.DeploymentConfig.model_validate(
-            json.loads(WORKFLOW_DEPLOYMENT_CONFIG)
-        )
+        deployment_config = _DEPLOYMENT_CONFIG
 
         # Set environment variables defined in the deployment config
         for key, value in deployment_config.environment.items():
@@ -194,18 +230,14 @@ def api_wrapper(args: Union[dict, str]) -> str:
 
         return {"trace_id": str(trace_id)}
     elif serve_workflow_parameters.action_type == input_types.DeployedWorkflowActions.GET_CONFIGURATION.value:
-        return {"configuration": json.loads(collated_input.model_dump_json())}
+        return {"configuration": collated_input.model_dump(mode="json")}
     elif serve_workflow_parameters.action_type == input_types.DeployedWorkflowActions.GET_ASSET_DATA.value:
         unavailable_assets = list()
         asset_data: Dict[str, str] = dict()
-        for asset_uri in list(set(serve_workflow_parameters.get_asset_data_inputs)):
+        for asset_uri in dict.fromkeys(serve_workflow_parameters.get_asset_data_inputs):
             # Ensure that the asset requested belongs to one of the tool instances or agents
-            matching_tool_ins = next(
-                (tool for tool in collated_input.tool_instances if tool.tool_image_uri == asset_uri), None
-            )
-            matching_agent = next(
-                (agent for agent in collated_input.agents if agent.agent_image_uri == asset_uri), None
-            )
+            matching_tool_ins = _tool_instances_by_image_uri.get(asset_uri)
+            matching_agent = _agents_by_image_uri.get(asset_uri)
             if (not matching_tool_ins) and (not matching_agent):
                 unavailable_assets.append(asset_uri)
                 continue
@@ -214,9 +246,8 @@ def api_wrapper(args: Union[dict, str]) -> str:
             if not os.path.exists(asset_path):
                 unavailable_assets.append(asset_uri)
                 continue
-            with open(asset_path, "rb") as asset_file:
-                asset_data[asset_uri] = base64.b64encode(asset_file.read()).decode()
-                # Decode at the destination with: base64.b64decode(asset_data[asset_uri])
+            asset_data[asset_uri] = _base64_encode_file(asset_path)
+            # Decode at the destination with: base64.b64decode(asset_data[asset_uri])
         return {"asset_data": asset_data, "unavailable_assets": unavailable_assets}
     elif serve_workflow_parameters.action_type == input_types.DeployedWorkflowActions.GET_MCP_TOOL_DEFINITIONS.value:
         return {"ready": _mcp_tool_defintions is not None, "mcp_tool_definitions": _mcp_tool_defintions}
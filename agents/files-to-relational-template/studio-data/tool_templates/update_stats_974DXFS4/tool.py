@@ -18,12 +18,31 @@ import argparse
 import psycopg2
 from psycopg2.extras import Json
 from psycopg2 import sql
+from psycopg2.pool import ThreadedConnectionPool
 from datetime import datetime, date
 import socket
+import ipaddress
+import threading
+import time
 from urllib.parse import urlparse, urlunparse
 import uuid
 
 
+# Seconds a resolved IPv4 address is reused before the hostname is looked up again
+DNS_CACHE_TTL = 60
+
+# (hostname, port) -> (IPv4 address, time.monotonic() of the lookup)
+_DNS_CACHE = {}
+
+# Connections kept open per connection string and shared across invocations
+POOL_MAX_CONNECTIONS = 10
+_POOLS = {}
+_POOLS_LOCK = threading.Lock()
+
+# (schema, table) pairs already seen to exist, so repeat calls skip the lookup
+_KNOWN_TABLES = set()
+
+
 class UserParameters(BaseModel):
     """
     Database connection parameters configured once per tool instance.
@@ -131,6 +150,9 @@ def table_exists(cursor, schema_name: str, table_name: str) -> bool:
     """
     Check if a table exists in the database.
     """
+    if (schema_name, table_name) in _KNOWN_TABLES:
+        return True
+    
     cursor.execute("""
         SELECT EXISTS (
             SELECT FROM information_schema.tables 
@@ -138,7 +160,24 @@ def table_exists(cursor, schema_name: str, table_name: str) -> bool:
             AND table_name = %s
         )
     """, (schema_name, table_name))
-    return cursor.fetchone()[0]
+    exists = cursor.fetchone()[0]
+    if exists:
+        _KNOWN_TABLES.add((schema_name, table_name))
+    return exists
+
+
+def resolve_ipv4(hostname: str, port: int) -> str:
+    """
+    Resolve a hostname to an IPv4 address, reusing the answer for DNS_CACHE_TTL seconds.
+    """
+    now = time.monotonic()
+    cached = _DNS_CACHE.get((hostname, port))
+    if cached and now - cached[1] < DNS_CACHE_TTL:
+        return cached[0]
+    
+    ipv4_address = socket.getaddrinfo(hostname, port, socket.AF_INET, socket.SOCK_STREAM)[0][4][0]
+    _DNS_CACHE[(hostname, port)] = (ipv4_address, now)
+    return ipv4_address
 
 
 def get_ipv4_connection_string(connection_string: str, force_ipv4: bool = True) -> str:
@@ -153,13 +192,15 @@ def get_ipv4_connection_string(connection_string: str, force_ipv4: bool = True)
         hostname = parsed.hostname
         
         if hostname:
+            # A literal IP address needs no lookup (an IPv6 one never resolves to IPv4)
             try:
-                ipv4_address = socket.getaddrinfo(
-                    hostname, 
-                    parsed.port or 5432, 
-                    socket.AF_INET,
-                    socket.SOCK_STREAM
-                )[0][4][0]
+                ipaddress.ip_address(hostname)
+                return connection_string
+            except ValueError:
+                pass
+            
+            try:
+                ipv4_address = resolve_ipv4(hostname, parsed.port or 5432)
                 
                 netloc = parsed.netloc.replace(hostname, ipv4_address)
                 new_parsed = parsed._replace(netloc=netloc)
@@ -172,6 +213,23 @@ def get_ipv4_connection_string(connection_string: str, force_ipv4: bool = True)
     return connection_string
 
 
+def get_connection_pool(conn_string: str, connect_timeout: int) -> ThreadedConnectionPool:
+    """
+    Get the connection pool for a connection string, creating it on first use.
+    """
+    with _POOLS_LOCK:
+        pool = _POOLS.get(conn_string)
+        if pool is None:
+            pool = ThreadedConnectionPool(
+                1,
+                POOL_MAX_CONNECTIONS,
+                dsn=conn_string,
+                connect_timeout=connect_timeout
+            )
+            _POOLS[conn_string] = pool
+        return pool
+
+
 def check_existing_record(cursor, schema_name: str, table_name: str, key_column: str, key_value: Any) -> Optional[str]:
     """
     Check if a record exists based on the key column.
@@ -230,6 +288,7 @@ def run_tool(config: UserParameters, args: ToolParameters) -> Any:
             "provided_columns": sorted(list(provided_columns))
         }
     
+    conn = None
     try:
         # Get connection string with IPv4 resolution
         conn_string = get_ipv4_connection_string(
@@ -237,11 +296,9 @@ def run_tool(config: UserParameters, args: ToolParameters) -> Any:
             config.force_ipv4
         )
         
-        # Connect to PostgreSQL
-        conn = psycopg2.connect(
-            dsn=conn_string,
-            connect_timeout=config.connection_timeout
-        )
+        # Borrow a pooled connection instead of connecting on every call
+        pool = get_connection_pool(conn_string, config.connection_timeout)
+        conn = pool.getconn()
         cursor = conn.cursor()
         
         schema_name, table_name = get_table_identifier(args.stats_table)
@@ -328,7 +385,6 @@ def run_tool(config: UserParameters, args: ToolParameters) -> Any:
         
         conn.commit()
         cursor.close()
-        conn.close()
         
         return {
             "success": True,
@@ -357,12 +413,19 @@ def run_tool(config: UserParameters, args: ToolParameters) -> Any:
             "rows_inserted": 0
         }
     except Exception as e:
+        # The failure may come from a table dropped since it was cached
+        _KNOWN_TABLES.clear()
         return {
             "success": False,
             "error": str(e),
             "error_type": type(e).__name__,
             "rows_inserted": 0
         }
+    finally:
+        if conn is not None:
+            # Hand the connection back for reuse; the pool rolls back any open
+            # transaction and broken connections are closed instead
+            pool.putconn(conn, close=bool(conn.closed))
 
 
 OUTPUT_KEY = "tool_output"
@@ -13,14 +13,40 @@ from pydantic import BaseModel, Field
 from typing import Optional, Any, List, Dict
 import json
 import argparse
+import io
 import psycopg2
-from psycopg2.extras import Json
+from psycopg2.extras import Json, execute_values
 from psycopg2 import sql
+from psycopg2.pool import ThreadedConnectionPool
 from datetime import datetime, date
 import socket
+import ipaddress
+import threading
+import time
 from urllib.parse import urlparse, urlunparse
 
 
+# Rows sent per multi-row INSERT statement
+INSERT_PAGE_SIZE = 1000
+
+# Inserts of at least this many rows are streamed with COPY instead
+COPY_MIN_ROWS = 10000
+
+# Seconds a resolved IPv4 address is reused before the hostname is looked up again
+DNS_CACHE_TTL = 60
+
+# (hostname, port) -> (IPv4 address, time.monotonic() of the lookup)
+_DNS_CACHE = {}
+
+# Connections kept open per connection string and shared across invocations
+POOL_MAX_CONNECTIONS = 10
+_POOLS = {}
+_POOLS_LOCK = threading.Lock()
+
+# (schema, table) pairs already seen to exist, so repeat calls skip the lookup
+_KNOWN_TABLES = set()
+
+
 class UserParameters(BaseModel):
     """
     Database connection parameters. These are configured once per tool instance.
@@ -127,10 +153,106 @@ def create_table(cursor, table_identifier, schema: Dict[str, str], primary_key:
     cursor.execute(create_sql)
 
 
+def row_values(row: Dict[str, Any], columns: List[str]) -> tuple:
+    """
+    Convert a row to a tuple of values in column order, wrapping dicts and lists as JSON.
+    """
+    values = []
+    for col in columns:
+        val = row.get(col)
+        if isinstance(val, (dict, list)):
+            values.append(Json(val))
+        else:
+            values.append(val)
+    return tuple(values)
+
+
+def copy_value(value: Any) -> str:
+    """
+    Render a value as a COPY CSV field. Every value is quoted so that only
+    None becomes the unquoted empty field COPY reads as NULL.
+    """
+    if value is None:
+        return ""
+    if isinstance(value, bool):
+        text = "true" if value else "false"
+    elif isinstance(value, Json):
+        text = json.dumps(value.adapted)
+    elif isinstance(value, (datetime, date)):
+        text = value.isoformat()
+    else:
+        text = str(value)
+    return '"' + text.replace('"', '""') + '"'
+
+
+def copy_rows(cursor, table_identifier, columns: List[str], rows: List[tuple]):
+    """
+    Stream rows into a table with COPY ... FROM STDIN in CSV format.
+    """
+    buffer = io.StringIO()
+    for values in rows:
+        buffer.write(",".join(map(copy_value, values)))
+        buffer.write("\n")
+    buffer.seek(0)
+    
+    copy_sql = sql.SQL("COPY {} ({}) FROM STDIN WITH (FORMAT csv)").format(
+        table_identifier,
+        sql.SQL(', ').join(map(sql.Identifier, columns))
+    )
+    cursor.copy_expert(copy_sql, buffer)
+
+
+def insert_rows(cursor, table_identifier, columns: List[str], rows: List[tuple], conflict_clause=None):
+    """
+    Insert rows with multi-row INSERT statements, or with COPY when there are at
+    least COPY_MIN_ROWS of them. conflict_clause is an optional ON CONFLICT clause.
+    """
+    column_list = sql.SQL(', ').join(map(sql.Identifier, columns))
+    
+    if len(rows) >= COPY_MIN_ROWS:
+        cursor.execute("SAVEPOINT copy_rows")
+        try:
+            if conflict_clause is None:
+                copy_rows(cursor, table_identifier, columns, rows)
+            else:
+                # COPY has no ON CONFLICT: stage the rows in a temporary table, then upsert from it.
+                # The staging table has only the loaded columns and no constraints, so target
+                # columns left to their defaults (serial keys, NOT NULL DEFAULT now()) don't apply.
+                staging_identifier = sql.Identifier("postgres_insert_staging")
+                cursor.execute(sql.SQL("CREATE TEMP TABLE {} ON COMMIT DROP AS SELECT {} FROM {} WITH NO DATA").format(
+                    staging_identifier,
+                    column_list,
+                    table_identifier
+                ))
+                copy_rows(cursor, staging_identifier, columns, rows)
+                cursor.execute(sql.SQL("INSERT INTO {} ({}) SELECT {} FROM {} {}").format(
+                    table_identifier,
+                    column_list,
+                    column_list,
+                    staging_identifier,
+                    conflict_clause
+                ))
+            cursor.execute("RELEASE SAVEPOINT copy_rows")
+            return
+        except (psycopg2.DataError, psycopg2.IntegrityError):
+            # COPY parses values from text strictly (e.g. 3.0 into an INTEGER
+            # column) where INSERT would cast them; fall back to INSERT, which
+            # also re-raises any constraint violation for the caller to handle
+            cursor.execute("ROLLBACK TO SAVEPOINT copy_rows")
+    
+    insert_query = sql.SQL("INSERT INTO {} ({}) VALUES %s").format(table_identifier, column_list)
+    if conflict_clause is not None:
+        insert_query = sql.SQL("{} {}").format(insert_query, conflict_clause)
+    execute_values(cursor, insert_query, rows, page_size=INSERT_PAGE_SIZE)
+
+
 def table_exists(cursor, schema_name: str, table_name: str) -> bool:
     """
     Check if a table exists in the database.
     """
+    if (schema_name, table_name) in _KNOWN_TABLES:
+        return True
+    
     cursor.execute("""
         SELECT EXISTS (
             SELECT FROM information_schema.tables 
@@ -138,7 +260,24 @@ def table_exists(cursor, schema_name: str, table_name: str) -> bool:
             AND table_name = %s
         )
     """, (schema_name, table_name))
-    return cursor.fetchone()[0]
+    exists = cursor.fetchone()[0]
+    if exists:
+        _KNOWN_TABLES.add((schema_name, table_name))
+    return exists
+
+
+def resolve_ipv4(hostname: str, port: int) -> str:
+    """
+    Resolve a hostname to an IPv4 address, reusing the answer for DNS_CACHE_TTL seconds.
+    """
+    now = time.monotonic()
+    cached = _DNS_CACHE.get((hostname, port))
+    if cached and now - cached[1] < DNS_CACHE_TTL:
+        return cached[0]
+    
+    ipv4_address = socket.getaddrinfo(hostname, port, socket.AF_INET, socket.SOCK_STREAM)[0][4][0]
+    _DNS_CACHE[(hostname, port)] = (ipv4_address, now)
+    return ipv4_address
 
 
 def get_ipv4_connection_string(connection_string: str, force_ipv4: bool = True) -> str:
@@ -154,14 +293,16 @@ def get_ipv4_connection_string(connection_string: str, force_ipv4: bool = True)
         hostname = parsed.hostname
         
         if hostname:
+            # A literal IP address needs no lookup (an IPv6 one never resolves to IPv4)
+            try:
+                ipaddress.ip_address(hostname)
+                return connection_string
+            except ValueError:
+                pass
+            
             # Try to resolve to IPv4
             try:
-                ipv4_address = socket.getaddrinfo(
-                    hostname, 
-                    parsed.port or 5432, 
-                    socket.AF_INET,  # Force IPv4
-                    socket.SOCK_STREAM
-                )[0][4][0]
+                ipv4_address = resolve_ipv4(hostname, parsed.port or 5432)
                 
                 # Replace hostname with IPv4 address
                 netloc = parsed.netloc.replace(hostname, ipv4_address)
@@ -176,6 +317,23 @@ def get_ipv4_connection_string(connection_string: str, force_ipv4: bool = True)
     return connection_string
 
 
+def get_connection_pool(conn_string: str, connect_timeout: int) -> ThreadedConnectionPool:
+    """
+    Get the connection pool for a connection string, creating it on first use.
+    """
+    with _POOLS_LOCK:
+        pool = _POOLS.get(conn_string)
+        if pool is None:
+            pool = ThreadedConnectionPool(
+                1,
+                POOL_MAX_CONNECTIONS,
+                dsn=conn_string,
+                connect_timeout=connect_timeout
+            )
+            _POOLS[conn_string] = pool
+        return pool
+
+
 def run_tool(config: UserParameters, args: ToolParameters) -> Any:
     """
     Main tool logic for inserting data into PostgreSQL tables.
@@ -189,6 +347,7 @@ def run_tool(config: UserParameters, args: ToolParameters) -> Any:
     
     schema_name = args.schema_name or config.default_schema
     
+    conn = None
     try:
         # Get connection string with IPv4 resolution if needed
         conn_string = get_ipv4_connection_string(
@@ -196,12 +355,9 @@ def run_tool(config: UserParameters, args: ToolParameters) -> Any:
             config.force_ipv4
         )
         
-        # Connect to PostgreSQL with timeout
-        # Use dsn parameter explicitly to avoid parsing issues
-        conn = psycopg2.connect(
-            dsn=conn_string,
-            connect_timeout=config.connection_timeout
-        )
+        # Borrow a pooled connection instead of connecting on every call
+        pool = get_connection_pool(conn_string, config.connection_timeout)
+        conn = pool.getconn()
         cursor = conn.cursor()
         
         # Create table identifier
@@ -216,6 +372,7 @@ def run_tool(config: UserParameters, args: ToolParameters) -> Any:
                 inferred_schema = infer_table_schema(args.data)
                 create_table(cursor, table_identifier, inferred_schema, args.primary_key)
                 conn.commit()
+                _KNOWN_TABLES.add((schema_name, args.table_name))
                 table_created = True
             else:
                 return {
@@ -229,13 +386,9 @@ def run_tool(config: UserParameters, args: ToolParameters) -> Any:
         # Prepare insert statement
         if args.data:
             columns = list(args.data[0].keys())
-            insert_query = sql.SQL("INSERT INTO {} ({}) VALUES ({})").format(
-                table_identifier,
-                sql.SQL(', ').join(map(sql.Identifier, columns)),
-                sql.SQL(', ').join(sql.Placeholder() * len(columns))
-            )
             
             # Add upsert clause if requested
+            conflict_clause = None
             if args.upsert:
                 if not args.primary_key:
                     return {
@@ -252,31 +405,25 @@ def run_tool(config: UserParameters, args: ToolParameters) -> Any:
                 ])
                 
                 conflict_cols = sql.SQL(', ').join(map(sql.Identifier, args.primary_key))
-                insert_query = sql.SQL("{} ON CONFLICT ({}) DO UPDATE SET {}").format(
-                    insert_query,
+                conflict_clause = sql.SQL("ON CONFLICT ({}) DO UPDATE SET {}").format(
                     conflict_cols,
                     update_clause
                 )
             
-            # Insert data
-            rows_inserted = 0
-            for row in args.data:
-                # Convert special types
-                values = []
-                for col in columns:
-                    val = row.get(col)
-                    if isinstance(val, (dict, list)):
-                        values.append(Json(val))
-                    else:
-                        values.append(val)
-                
-                cursor.execute(insert_query, values)
-                rows_inserted += 1
+            # Insert data in multi-row statements, or with COPY for large batches
+            rows = [row_values(row, columns) for row in args.data]
+            if args.upsert and all(pk in columns for pk in args.primary_key):
+                # One statement can't upsert the same key twice; keep the last row per
+                # key, which is the state row-by-row upserts would have left behind
+                key_indexes = [columns.index(pk) for pk in args.primary_key]
+                rows = list({tuple(values[i] for i in key_indexes): values for values in rows}.values())
+            
+            insert_rows(cursor, table_identifier, columns, rows, conflict_clause)
+            rows_inserted = len(args.data)
             
             conn.commit()
         
         cursor.close()
-        conn.close()
         
         return {
             "success": True,
@@ -305,12 +452,19 @@ def run_tool(config: UserParameters, args: ToolParameters) -> Any:
             "rows_inserted": 0
         }
     except Exception as e:
+        # The failure may come from a table dropped since it was cached
+        _KNOWN_TABLES.clear()
         return {
             "success": False,
             "error": str(e),
             "error_type": type(e).__name__,
             "rows_inserted": 0
         }
+    finally:
+        if conn is not None:
+            # Hand the connection back for reuse; the pool rolls back any open
+            # transaction and broken connections are closed instead
+            pool.putconn(conn, close=bool(conn.closed))
 
 
 OUTPUT_KEY = "tool_output"
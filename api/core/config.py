@@ -1,13 +1,14 @@
 """
 Configuration management for the API
 """
-from pydantic_settings import BaseSettings
-import os
+from pydantic_settings import BaseSettings, SettingsConfigDict
 from functools import lru_cache
 
 
 class Settings(BaseSettings):
-    """Application settings"""
+    """Application settings, read from the environment and .env once via get_settings()"""
+    
+    model_config = SettingsConfigDict(env_file=".env", case_sensitive=True, frozen=True)
     
     # API Settings
     HOST: str = "0.0.0.0"
@@ -15,33 +16,23 @@ class Settings(BaseSettings):
     DEBUG: bool = True
     
     # Backend Database Settings
-    BACKEND_DATABASE_URL: str = os.getenv(
-        "BACKEND_DATABASE_URL",
-        ""
-    )
+    BACKEND_DATABASE_URL: str = ""
     
     # Cloudera AI Agent Studio Settings
-    CLOUDERA_API_URL: str = os.getenv("CLOUDERA_API_URL", "")
-    CLOUDERA_API_KEY: str = os.getenv("CLOUDERA_API_KEY", "")
-    CLOUDERA_WORKSPACE_ID: str = os.getenv("CLOUDERA_WORKSPACE_ID", "")
+    CLOUDERA_API_URL: str = ""
+    CLOUDERA_API_KEY: str = ""
+    CLOUDERA_WORKSPACE_ID: str = ""
     
     # OpenAI Settings
-    OPENAI_API_KEY: str = os.getenv("OPENAI_API_KEY", "")
-    OPENAI_MODEL: str = os.getenv("OPENAI_MODEL", "gpt-4o-mini")
+    OPENAI_API_KEY: str = ""
+    OPENAI_MODEL: str = "gpt-4o-mini"
     
     # Deployed Workflow Settings
-    DEPLOYED_WORKFLOW_URL: str = os.getenv(
-        "DEPLOYED_WORKFLOW_URL",
-        ""
-    )
-    CDSW_APIV2_KEY: str = os.getenv("CDSW_APIV2_KEY", "")
-    CDSW_PROJECT_ID: str = os.getenv("CDSW_PROJECT_ID", "")
-    CDSW_DOMAIN: str = os.getenv("CDSW_DOMAIN", "")
-    CDSW_APP_PORT: int = int(os.getenv("CDSW_APP_PORT", "9000"))
-    
-    class Config:
-        env_file = ".env"
-        case_sensitive = True
+    DEPLOYED_WORKFLOW_URL: str = ""
+    CDSW_APIV2_KEY: str = ""
+    CDSW_PROJECT_ID: str = ""
+    CDSW_DOMAIN: str = ""
+    CDSW_APP_PORT: int = 9000
 
 
 @lru_cache()
@@ -1,33 +1,44 @@
 """
 Database connection pool management
 """
+import asyncio
+import os
 import asyncpg
 from typing import Optional
 from api.core.config import settings
 
+# Warm connections scale with the host's CPUs, capped to spare the database
+POOL_MIN_SIZE = min(max(4, os.cpu_count() or 1), 10)
+POOL_MAX_SIZE = max(10, 2 * POOL_MIN_SIZE)
+
 
 class DatabasePool:
     """Singleton database connection pool manager"""
     
     _instance: Optional['DatabasePool'] = None
     _pool: Optional[asyncpg.Pool] = None
+    _lock: asyncio.Lock
     
     def __new__(cls):
         if cls._instance is None:
             cls._instance = super().__new__(cls)
+            cls._instance._lock = asyncio.Lock()
         return cls._instance
     
     async def get_pool(self) -> asyncpg.Pool:
         """Get or create the connection pool with size limits"""
         if self._pool is None:
-            self._pool = await asyncpg.create_pool(
-                settings.BACKEND_DATABASE_URL,
-                min_size=2,  # Minimum connections to maintain
-                max_size=10,  # Maximum connections allowed
-                max_queries=50000,  # Recycle connection after this many queries
-                max_inactive_connection_lifetime=300.0,  # Close idle connections after 5 minutes
-                command_timeout=60.0  # Query timeout
-            )
+            # Concurrent first requests must not each create a pool
+            async with self._lock:
+                if self._pool is None:
+                    self._pool = await asyncpg.create_pool(
+                        settings.BACKEND_DATABASE_URL,
+                        min_size=POOL_MIN_SIZE,  # Minimum connections to maintain
+                        max_size=POOL_MAX_SIZE,  # Maximum connections allowed
+                        max_queries=50000,  # Recycle connection after this many queries
+                        max_inactive_connection_lifetime=300.0,  # Close idle connections after 5 minutes
+                        command_timeout=60.0  # Query timeout
+                    )
         return self._pool
     
     async def close(self):
@@ -21,6 +21,12 @@ CREATE TABLE IF NOT EXISTS xtracticai.file_processing_stats (
     completed_at TIMESTAMP
 );
 
+-- Joined to workflow submissions by file name; recent uploads are listed by upload time
+CREATE INDEX IF NOT EXISTS idx_file_processing_stats_file_name
+    ON xtracticai.file_processing_stats (file_name);
+CREATE INDEX IF NOT EXISTS idx_file_processing_stats_uploaded_at
+    ON xtracticai.file_processing_stats (uploaded_at);
+
 -- Workflow submissions table (for tracking trace_id based submissions)
 CREATE TABLE IF NOT EXISTS xtracticai.workflow_submissions (
     id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
@@ -42,3 +48,7 @@ CREATE TABLE IF NOT EXISTS xtracticai.workflow_submissions (
     wf_output TEXT,
     crew_kickoff_completed BOOLEAN DEFAULT FALSE
 );
+
+-- Submission stats are filtered by status
+CREATE INDEX IF NOT EXISTS idx_workflow_submissions_status
+    ON xtracticai.workflow_submissions (status);
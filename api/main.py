@@ -5,6 +5,7 @@ Integrates with Cloudera AI Agent Studio, MCP Servers, RAG, and Supabase
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from contextlib import asynccontextmanager
+import asyncio
 import threading
 import uvicorn
 import os
@@ -27,22 +28,12 @@ async def lifespan(app: FastAPI):
 
 
 def create_app():
-    CDSW_DOMAIN = os.getenv('CDSW_DOMAIN')
     app = FastAPI(lifespan=lifespan)
     app.add_middleware(
         CORSMiddleware,
-        allow_origins=[
-            "*",
-            f"https://xtracticai-api.{CDSW_DOMAIN}",
-            f"https://xtracticai-ui.{CDSW_DOMAIN}",
-            f"https://{CDSW_DOMAIN}",
-            f"https://*.{CDSW_DOMAIN}",
-            f"*.{CDSW_DOMAIN}",
-            "*.cloudera.site",
-            "http://localhost:5173",
-            "http://localhost:3000",
-            "http://localhost:8000",
-        ],
+        # "*" already admits every origin (echoed back since credentials are allowed),
+        # so listing specific hosts alongside it has no effect
+        allow_origins=["*"],
         allow_credentials=True,
         allow_methods=["*"],
         allow_headers=["*"],
@@ -72,15 +63,26 @@ def create_app():
     
     return app
 
-def run_server(app, host="127.0.0.1", port=None, log_level="warning", reload=False):
+def run_server(app, host="127.0.0.1", port=None, log_level="warning", reload=False, workers=None, factory=False):
     if port is None:
         port = int(os.getenv('CDSW_APP_PORT', 9000))  # Default to 8080 if API_PORT is not set
-    uvicorn.run(app, host=host, port=port, log_level=log_level, reload=reload)
+    if workers is None:
+        # Event listeners live in-process, so only fan out when asked to
+        workers = int(os.getenv('WEB_CONCURRENCY', 1))
+    # uvicorn[standard] picks uvloop and httptools automatically
+    uvicorn.run(app, host=host, port=port, log_level=log_level, reload=reload, workers=workers, factory=factory)
 
 def main():
-    app = create_app()
-    server_thread = threading.Thread(target=run_server, args=(app,))
-    server_thread.start()
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        # Plain process: uvicorn owns the event loop and builds the app in each worker
+        run_server("api.main:create_app", factory=True)
+    else:
+        # Launched from a kernel that already runs an event loop (e.g. CML/IPython),
+        # where uvicorn.run cannot start its own; serve from a thread instead
+        server_thread = threading.Thread(target=run_server, args=(create_app(),), kwargs={"workers": 1})
+        server_thread.start()
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
@@ -3,8 +3,10 @@ Chat router for OpenAI integration
 Handles chat requests with context-aware responses about organizational data and workflows
 """
 from fastapi import APIRouter, HTTPException, Depends
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
-from typing import List, Optional
+from typing import AsyncIterator, List, Optional
+import json
 import openai
 from api.core.config import settings
 
@@ -38,6 +40,21 @@ If a user asks a question outside your scope, politely respond: "I can only assi
 
 Always provide accurate, helpful information about Xtractic AI's systems and be concise in your responses."""
 
+# Static system message, kept byte-identical at the head of every request so
+# the provider's prompt prefix cache can be reused
+_SYSTEM_MSG = {"role": "system", "content": SYSTEM_PROMPT}
+
+# Shared async OpenAI client (reuses its HTTP connection pool across requests)
+_openai_client: Optional[openai.AsyncOpenAI] = None
+
+
+def get_openai_client() -> openai.AsyncOpenAI:
+    """Get the shared OpenAI client, creating it on first use"""
+    global _openai_client
+    if _openai_client is None:
+        _openai_client = openai.AsyncOpenAI(api_key=settings.OPENAI_API_KEY)
+    return _openai_client
+
 
 class ChatMessage(BaseModel):
     """Chat message model"""
@@ -48,6 +65,7 @@ class ChatMessage(BaseModel):
 class ChatRequest(BaseModel):
     """Chat request model - receives conversation messages from UI"""
     messages: List[ChatMessage]
+    stream: bool = False
 
 
 class ChatResponse(BaseModel):
@@ -57,6 +75,18 @@ class ChatResponse(BaseModel):
     usage: Optional[dict] = None
 
 
+async def _stream_deltas(stream) -> AsyncIterator[str]:
+    """Relay OpenAI completion chunks as server-sent events"""
+    try:
+        async for chunk in stream:
+            if chunk.choices and chunk.choices[0].delta.content:
+                yield f"data: {json.dumps({'delta': chunk.choices[0].delta.content})}\n\n"
+    except openai.APIError as e:
+        # Headers are already sent, so report the failure in-band
+        yield f"data: {json.dumps({'error': f'OpenAI API error: {str(e)}'})}\n\n"
+    yield "data: [DONE]\n\n"
+
+
 @router.post("/chat", response_model=ChatResponse)
 async def chat(request: ChatRequest):
     """
@@ -67,7 +97,8 @@ async def chat(request: ChatRequest):
         request: ChatRequest containing the full conversation message history
         
     Returns:
-        ChatResponse with the AI's response
+        ChatResponse with the AI's response, or a text/event-stream of
+        token deltas when request.stream is set
     """
     try:
         # Validate OpenAI API key
@@ -77,28 +108,27 @@ async def chat(request: ChatRequest):
                 detail="OpenAI API key not configured"
             )
         
-        # Set OpenAI API key
-        openai.api_key = settings.OPENAI_API_KEY
-        
-        # Build messages array with system prompt
+        # Build messages array: system prompt followed by the conversation history
         messages = [
-            {"role": "system", "content": SYSTEM_PROMPT}
+            _SYSTEM_MSG,
+            *({"role": msg.role, "content": msg.content} for msg in request.messages)
         ]
         
-        # Add all messages from the conversation history
-        messages.extend([
-            {"role": msg.role, "content": msg.content}
-            for msg in request.messages
-        ])
-        
         # Call OpenAI API with hardcoded parameters
-        response = openai.chat.completions.create(
+        response = await get_openai_client().chat.completions.create(
             model=settings.OPENAI_MODEL or "gpt-4o-mini",
             messages=messages,
             max_tokens=1500,
             temperature=0.7,
+            stream=request.stream,
         )
         
+        if request.stream:
+            return StreamingResponse(
+                _stream_deltas(response),
+                media_type="text/event-stream"
+            )
+        
         # Extract response
         assistant_message = response.choices[0].message.content
         
@@ -5,8 +5,8 @@ from fastapi import APIRouter, HTTPException
 from typing import Optional
 from pydantic import BaseModel
 
-from api.services.cloudera_service import ClouderaService
-from api.services.workflow_service import WorkflowService
+from api.services.cloudera_service import cloudera_service
+from api.services.workflow_service import workflow_service
 from api.services.event_listener_service import event_listener_service
 from api.utils.cloudera_utils import (
     get_all_cloudera_env_vars,
@@ -38,8 +38,6 @@ async def get_workflows_stats(
     - extracted filename from uploaded_file_url in workflow_submissions
     """
     try:
-        workflow_service = WorkflowService()
-        
         stats = await workflow_service.get_workflow_submission_stats(
             limit=limit,
             status=status
@@ -68,8 +66,6 @@ async def get_workflow_details():
     - Total records extracted
     """
     try:
-        workflow_service = WorkflowService()
-        
         details = await workflow_service.get_workflow_details_summary()
         
         return {
@@ -166,7 +162,6 @@ async def get_deployed_workflows():
 async def submit_workflow(request: WorkflowSubmitRequest):
     """Submit workflow with PDF URL and query to Agent Studio"""
     try:
-        cloudera_service = ClouderaService()
         result = await cloudera_service.submit_workflow(
             uploaded_file_url=request.uploaded_file_url,
             query=request.query
@@ -187,7 +182,6 @@ async def get_workflow_status(trace_id: str):
     Note: This endpoint also ensures the background event listener is running
     """
     try:
-        cloudera_service = ClouderaService()
         status = await cloudera_service.get_workflow_submission_status(trace_id)
         return status
     except Exception as e:
@@ -269,3 +269,7 @@ class ClouderaService:
                         }
             except Exception as e:
                 raise Exception(f"Error checking workflow status: {str(e)}")
+
+
+# Singleton instance
+cloudera_service = ClouderaService()
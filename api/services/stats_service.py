@@ -31,14 +31,15 @@ class StatsService:
     ) -> str:
         """Track file upload"""
         pool = await self._get_pool()
-        new_id = str(uuid.uuid4())
         async with pool.acquire() as conn:
-            await conn.execute("""
+            # id comes from the column's gen_random_uuid() default
+            new_id = await conn.fetchval("""
                 INSERT INTO xtracticai.file_processing_stats
-                (id, file_name, file_type, file_size_bytes, processing_status, workflow_id, workflow_name)
-                VALUES ($1, $2, $3, $4, $5, $6, $7)
-            """, uuid.UUID(new_id), file_name, file_type, file_size_bytes, "processing", workflow_id, workflow_name)
-        return new_id
+                (file_name, file_type, file_size_bytes, processing_status, workflow_id, workflow_name)
+                VALUES ($1, $2, $3, $4, $5, $6)
+                RETURNING id
+            """, file_name, file_type, file_size_bytes, "processing", workflow_id, workflow_name)
+        return str(new_id)
     
     async def update_file_processing(
         self,
@@ -299,3 +299,7 @@ class WorkflowService:
                 "workflows": workflows,
                 "count": len(workflows)
             }
+
+
+# Singleton instance
+workflow_service = WorkflowService()
@@ -14,7 +14,6 @@ import argparse
 import os
 import subprocess
 import uuid
-import json
 
 class UserParameters(BaseModel):
     workload_user: str # This is your CDP workload username  
@@ -46,45 +45,26 @@ def run_tool(config: UserParameters, args: ToolParameters) -> str:
     uid = str(uuid.uuid4())[:8]
     deployment_name="hf_to_CDP_%s"%uid
     
-    readyflow_paramaters_json_tmpl = """[
-{{
-"name": "huggingface-to-S3-ADLS",
-"parameters": [
-    {{
-    "name": "CDP Workload User",
-    "assetReferences": [],
-    "value": "{workload_user}"
-    }},
-    {{
-    "name": "CDP Workload User Password",
-    "assetReferences": [],
-    "value": "{workload_pass}"
-    }},
-    {{
-    "name": "CDPEnvironment",
-    "assetReferences": [],
-    "value": "/home/nifi/additional/secret/env_config/core-site.xml,/home/nifi/additional/secret/env_config/ssl-client.xml,/home/nifi/additional/secret/env_config/hive-site.xml"
-    }},
-    {{
-    "name": "Dataset Name",
-    "assetReferences": [],
-    "value": "{hf_dataset}"
-    }},
-    {{
-    "name": "Destination S3 or ADLS Path",
-    "assetReferences": [],
-    "value": "{s3_path}"
-    }},
-    {{
-    "name": "Destination S3 or ADLS Storage Location",
-    "assetReferences": [],
-    "value": "{s3_bucket}"
-    }}
-]
-}}
-]
-"""
-    readyflow_paramaters_json = readyflow_paramaters_json_tmpl.format(workload_user=config.workload_user, workload_pass=config.workload_pass, hf_dataset=hf_dataset, s3_path=s3_path, s3_bucket=s3_bucket)
+    readyflow_parameters = [
+        {
+            "name": "huggingface-to-S3-ADLS",
+            "parameters": [
+                {"name": "CDP Workload User", "assetReferences": [], "value": config.workload_user},
+                {"name": "CDP Workload User Password", "assetReferences": [], "value": config.workload_pass},
+                {
+                    "name": "CDPEnvironment",
+                    "assetReferences": [],
+                    "value": "/home/nifi/additional/secret/env_config/core-site.xml,/home/nifi/additional/secret/env_config/ssl-client.xml,/home/nifi/additional/secret/env_config/hive-site.xml",
+                },
+                {"name": "Dataset Name", "assetReferences": [], "value": hf_dataset},
+                {"name": "Destination S3 or ADLS Path", "assetReferences": [], "value": s3_path},
+                {"name": "Destination S3 or ADLS Storage Location", "assetReferences": [], "value": s3_bucket},
+            ],
+        }
+    ]
+    # Serializing a dict (rather than formatting a JSON template) keeps the file
+    # valid when values contain quotes or backslashes.
+    readyflow_paramaters_json = json.dumps(readyflow_parameters, indent=2)
     print(readyflow_paramaters_json)
     readyflow_params_path = "/tmp/readyflow_%s_params.json" % uid
     with open(readyflow_params_path, "w") as text_file:
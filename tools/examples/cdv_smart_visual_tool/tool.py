@@ -15,10 +15,27 @@ from typing import List, Dict, Optional, Literal, Type
 from pydantic import Field, BaseModel
 from pydantic import BaseModel as StudioBaseTool
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from urllib.parse import urljoin
 import argparse
 
 
+# Shared across invocations so repeated calls against the same CDV host reuse
+# pooled keep-alive connections instead of paying a new TLS handshake each time.
+# Retry only covers idempotent requests (the login GET); the visual-creating POST
+# is never replayed.
+_SESSION = requests.Session()
+_SESSION.mount(
+    "https://",
+    HTTPAdapter(
+        pool_connections=16,
+        pool_maxsize=16,
+        max_retries=Retry(total=3, backoff_factor=0.2, status_forcelist=[502, 503, 504]),
+    ),
+)
+
+
 class UserParameters(BaseModel):
     cdv_base_url: str
     cml_apiv2_app_key: str
@@ -61,11 +78,12 @@ def run_tool(
         "accept": "application/json",
         "Content-Type": "application/x-www-form-urlencoded",
         "Authorization": f"bearer {config.cml_apiv2_app_key}",
+        "Connection": "keep-alive",
     }
 
     login_path = "arc/apps"
     login_url = urljoin(config.cdv_base_url, login_path)
-    session = requests.Session()
+    session = _SESSION
     login_response = session.get(login_url, headers=request_headers)
     if login_response.status_code != 200:
         raise Exception(f"Failed to login to CDV: {login_response.text}")
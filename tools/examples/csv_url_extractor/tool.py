@@ -22,15 +22,46 @@ Returns:
     dict or str: Extracted content from the CSV, including headers and data rows
 """
 
-from typing import Literal, Optional, Dict, List, Any
+from typing import Literal, Optional, Dict, List, Any, Iterable, Iterator, TextIO
 from pydantic import BaseModel, Field
-import json
+import orjson
 import argparse
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import tempfile
 import csv
+import re
 from pathlib import Path
-from io import StringIO
+from io import BytesIO, StringIO, TextIOWrapper
+from contextlib import contextmanager
+from itertools import islice
+try:
+    # Multithreaded C++ CSV reader, used for large full loads when available
+    import pyarrow as pa
+    from pyarrow import csv as pa_csv
+except ImportError:
+    pa_csv = None
+
+
+# Full loads at least this large are parsed with pyarrow instead of the csv module
+ARROW_MIN_BYTES = 1_000_000
+
+# A line terminator directly after the start of the file or another terminator.
+# The csv module returns these blank lines as empty rows, pyarrow as empty strings.
+_BLANK_LINE = re.compile(rb"\A[\r\n]|\n[\r\n]|\r\r")
+
+
+# Shared across invocations so repeated downloads from the same host reuse
+# pooled keep-alive connections instead of opening a new one each time
+_SESSION = requests.Session()
+_ADAPTER = HTTPAdapter(
+    pool_connections=10,
+    pool_maxsize=50,
+    max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[502, 503, 504])
+)
+_SESSION.mount("https://", _ADAPTER)
+_SESSION.mount("http://", _ADAPTER)
 
 
 class UserParameters(BaseModel):
@@ -62,37 +93,117 @@ class ToolParameters(BaseModel):
     )
 
 
-def download_csv(url: str) -> str:
+@contextmanager
+def download_csv(url: str) -> Iterator[TextIO]:
     """
-    Download CSV from URL and return content as string
+    Stream CSV from URL as a text file object, decoded while it downloads
     
     Args:
         url: URL of the CSV file
         
+    Yields:
+        Text file object over the CSV content
+    """
+    with _SESSION.get(url, stream=True, timeout=30) as response:
+        response.raise_for_status()
+        
+        # Verify content type (be flexible as CSV can have various content types)
+        content_type = response.headers.get('content-type', '').lower()
+        valid_types = ['text/csv', 'application/csv', 'text/plain', 'application/octet-stream']
+        
+        if not any(ct in content_type for ct in valid_types) and not url.lower().endswith('.csv'):
+            # Still try to process it, but warn
+            print(f"Warning: Content-Type is '{content_type}', expected CSV format")
+        
+        # Undo any gzip/deflate transfer encoding and keep the raw stream open
+        # after EOF so the number of bytes read can still be reported
+        response.raw.decode_content = True
+        response.raw.auto_close = False
+        yield TextIOWrapper(
+            response.raw,
+            encoding=response.encoding or "utf-8",
+            errors="replace",
+            newline=""
+        )
+
+
+def _read_csv_rows_arrow(csv_bytes: bytes, encoding: str, delimiter: str) -> Optional[List[List[str]]]:
+    """
+    Parse CSV bytes into rows of strings with pyarrow
+    
+    Args:
+        csv_bytes: Raw CSV content
+        encoding: Text encoding of the content
+        delimiter: CSV delimiter character
+        
     Returns:
-        CSV content as string
+        List of rows, or None if the content can't be parsed exactly as the csv module would
     """
-    response = requests.get(url, timeout=30)
-    response.raise_for_status()
+    if _BLANK_LINE.search(csv_bytes):
+        return None
     
-    # Verify content type (be flexible as CSV can have various content types)
-    content_type = response.headers.get('content-type', '').lower()
-    valid_types = ['text/csv', 'application/csv', 'text/plain', 'application/octet-stream']
+    # Size the table from the first record so every column is read as a string, unconverted
+    sample = csv_bytes[:65536].decode(encoding, errors="replace")
+    first_row = next(csv.reader(StringIO(sample), delimiter=delimiter), None)
+    if not first_row or len(first_row) < 2:
+        return None
     
-    if not any(ct in content_type for ct in valid_types) and not url.lower().endswith('.csv'):
-        # Still try to process it, but warn
-        print(f"Warning: Content-Type is '{content_type}', expected CSV format")
+    column_names = [f"f{i}" for i in range(len(first_row))]
+    try:
+        table = pa_csv.read_csv(
+            BytesIO(csv_bytes),
+            read_options=pa_csv.ReadOptions(column_names=column_names, encoding=encoding),
+            parse_options=pa_csv.ParseOptions(
+                delimiter=delimiter,
+                newlines_in_values=True,
+                ignore_empty_lines=False
+            ),
+            convert_options=pa_csv.ConvertOptions(
+                column_types={name: pa.string() for name in column_names}
+            )
+        )
+    except (pa.ArrowInvalid, UnicodeDecodeError):
+        # Ragged rows or undecodable bytes: leave these to the csv module
+        return None
     
-    return response.text
+    return [list(row) for row in zip(*(column.to_pylist() for column in table.columns))]
 
 
-def extract_csv_content(csv_text: str, delimiter: str, has_header: bool, max_rows: int) -> Dict[str, Any]:
+def read_csv_rows(csv_file: TextIO, delimiter: str, max_rows: int) -> Iterable[List[str]]:
     """
-    Extract data from CSV content
+    Parse rows from a CSV text file object
+    
+    Large full loads (max_rows=0) are parsed with pyarrow when it is installed;
+    everything else streams through the csv module.
     
     Args:
-        csv_text: CSV content as string
+        csv_file: CSV content as a text file object
         delimiter: CSV delimiter character
+        max_rows: Maximum rows to extract (0 = all)
+        
+    Returns:
+        Iterable of rows, each a list of field strings
+    """
+    if max_rows == 0 and pa_csv is not None:
+        csv_bytes = csv_file.buffer.read()
+        if len(csv_bytes) >= ARROW_MIN_BYTES:
+            rows = _read_csv_rows_arrow(csv_bytes, csv_file.encoding, delimiter)
+            if rows is not None:
+                return rows
+        csv_file = StringIO(csv_bytes.decode(csv_file.encoding, errors="replace"))
+    
+    return csv.reader(csv_file, delimiter=delimiter)
+
+
+def extract_csv_content(csv_rows: Iterable[List[str]], has_header: bool, max_rows: int) -> Dict[str, Any]:
+    """
+    Extract data from CSV content
+    
+    Rows past max_rows are still parsed so total_rows is exact; they are
+    counted but not kept.
+    
+    Args:
+        csv_rows: Parsed CSV rows
         has_header: Whether CSV has header row
         max_rows: Maximum rows to extract (0 = all)
         
@@ -105,11 +216,10 @@ def extract_csv_content(csv_text: str, delimiter: str, has_header: bool, max_row
         "metadata": {}
     }
     
-    # Parse CSV
-    csv_reader = csv.reader(StringIO(csv_text), delimiter=delimiter)
-    rows = list(csv_reader)
+    rows = iter(csv_rows)
+    first_row = next(rows, None)
     
-    if not rows:
+    if first_row is None:
         result["metadata"] = {
             "total_rows": 0,
             "total_columns": 0,
@@ -118,40 +228,43 @@ def extract_csv_content(csv_text: str, delimiter: str, has_header: bool, max_row
         return result
     
     # Extract headers
-    if has_header and rows:
-        result["headers"] = rows[0]
-        data_rows = rows[1:]
+    data_rows = []
+    if has_header:
+        result["headers"] = first_row
     else:
         # Generate generic headers
-        num_cols = len(rows[0]) if rows else 0
-        result["headers"] = [f"Column_{i+1}" for i in range(num_cols)]
-        data_rows = rows
+        result["headers"] = [f"Column_{i+1}" for i in range(len(first_row))]
+        data_rows.append(first_row)
     
-    # Apply max_rows limit
+    # Apply max_rows limit; rows past it are only counted, never kept
     if max_rows > 0:
-        data_rows = data_rows[:max_rows]
+        data_rows.extend(islice(rows, max_rows - len(data_rows)))
+        total_rows = len(data_rows) + sum(1 for _ in rows)
+    else:
+        data_rows.extend(rows)
+        total_rows = len(data_rows)
     
     result["data"] = data_rows
     
     # Calculate metadata
     result["metadata"] = {
-        "total_rows": len(rows) - (1 if has_header else 0),
+        "total_rows": total_rows,
         "total_columns": len(result["headers"]),
         "rows_returned": len(data_rows),
-        "has_header": has_header,
-        "delimiter": delimiter
+        "has_header": has_header
     }
     
     return result
 
 
-def format_output(content: Dict[str, Any], output_format: str) -> str:
+def format_output(content: Dict[str, Any], output_format: str, compact: bool = False) -> str:
     """
     Format the extracted content based on the requested format
     
     Args:
         content: Extracted CSV content
         output_format: Desired output format ('json' or 'text')
+        compact: Emit JSON without indentation
         
     Returns:
         Formatted string output
@@ -184,38 +297,39 @@ def format_output(content: Dict[str, Any], output_format: str) -> str:
         return "\n".join(output_lines)
     
     else:  # json format
-        return json.dumps(content, indent=2, ensure_ascii=False)
+        return orjson.dumps(content, option=0 if compact else orjson.OPT_INDENT_2).decode()
 
 
-def run_tool(config: UserParameters, args: ToolParameters) -> str:
+def run_tool(config: UserParameters, args: ToolParameters, compact_output: bool = False) -> str:
     """
     Main tool execution function
     
     Args:
         config: User configuration
         args: Tool parameters
+        compact_output: Emit JSON output without indentation
         
     Returns:
         Extracted CSV content in the requested format
     """
     try:
-        # Download the CSV
+        # Download the CSV and extract content as it streams in
         print(f"Downloading CSV from: {args.csv_url}")
-        csv_text = download_csv(args.csv_url)
-        print(f"CSV downloaded successfully ({len(csv_text)} bytes)")
-        
-        # Extract content
-        print("Extracting CSV content...")
-        content = extract_csv_content(
-            csv_text,
-            args.delimiter,
-            args.has_header,
-            args.max_rows
-        )
+        with download_csv(args.csv_url) as csv_file:
+            print("Extracting CSV content as it downloads...")
+            content = extract_csv_content(
+                read_csv_rows(csv_file, args.delimiter, args.max_rows),
+                args.has_header,
+                args.max_rows
+            )
+            print(f"CSV downloaded successfully ({csv_file.buffer.tell()} bytes)")
+        if "has_header" in content["metadata"]:
+            # Parsing already happened upstream; the delimiter is only reported
+            content["metadata"]["delimiter"] = args.delimiter
         print(f"Extraction complete: {content['metadata']['rows_returned']} rows, {content['metadata']['total_columns']} columns")
         
         # Format output
-        output = format_output(content, args.output_format)
+        output = format_output(content, args.output_format, compact_output)
         return output
         
     except requests.RequestException as e:
@@ -246,16 +360,27 @@ if __name__ == "__main__":
         required=True,
         help="JSON string for tool arguments"
     )
+    parser.add_argument(
+        "--trusted",
+        action="store_true",
+        help="Skip validation of pre-validated parameters from a trusted caller"
+    )
+    parser.add_argument(
+        "--compact-output",
+        action="store_true",
+        help="Emit JSON output without indentation (much smaller for large files)"
+    )
     args = parser.parse_args()
     
-    # Parse JSON into dictionaries
-    config_dict = json.loads(args.user_params)
-    params_dict = json.loads(args.tool_params)
-    
-    # Validate dictionaries against Pydantic models
-    config = UserParameters(**config_dict)
-    params = ToolParameters(**params_dict)
+    if args.trusted:
+        # Caller guarantees the JSON already matches the models; skip validation
+        config = UserParameters.model_construct(**orjson.loads(args.user_params))
+        params = ToolParameters.model_construct(**orjson.loads(args.tool_params))
+    else:
+        # Parse and validate the JSON arguments against the Pydantic models in one pass
+        config = UserParameters.model_validate_json(args.user_params)
+        params = ToolParameters.model_validate_json(args.tool_params)
     
     # Run the tool
-    output = run_tool(config, params)
+    output = run_tool(config, params, args.compact_output)
     print(OUTPUT_KEY, output)
@@ -9,7 +9,6 @@ from pydantic import BaseModel as StudioBaseTool
 import os
 import json
 import argparse
-import glob
 
 class UserParameters(BaseModel):
     pass
@@ -30,14 +29,15 @@ def run_tool(
     # Remove trailing slash if present
     directory = directory.rstrip("/")
     
-    # Verify that the directory exists
-    if not os.path.isdir(directory):
+    # List top-level items (files + directories) in the directory. scandir
+    # reports a missing path or a non-directory itself, so no separate stat
+    # is needed. Hidden entries are skipped to match the previous glob("*").
+    try:
+        with os.scandir(directory) as entries:
+            items = [entry.path for entry in entries if not entry.name.startswith(".")]
+    except (FileNotFoundError, NotADirectoryError):
         return f"Error: {directory} is not a directory."
 
-    # Use glob to get top-level items (files + directories) in the directory
-    pattern = os.path.join(directory, "*")
-    items = glob.glob(pattern)
-
     return items
 
 
@@ -9,9 +9,11 @@ from pydantic import BaseModel, Field
 from typing import Any, Optional, Literal
 import json
 import argparse
+import hashlib
 from pathlib import Path
-import pandas as pd
+from decimal import Decimal
 import duckdb
+import orjson
 import sys 
 import os
 
@@ -19,6 +21,58 @@ ROOT_DIR = Path(__file__).parent
 sys.path.append(str(ROOT_DIR))
 os.chdir(ROOT_DIR)
 
+# A single connection is kept for the life of the process so repeated tool calls
+# share DuckDB's catalog and caches instead of going through the implicit default.
+# Parquet footers (schema, row-group statistics) are cached so repeated queries
+# against the same file skip re-reading its metadata.
+_CON = duckdb.connect(":memory:")
+_CON.execute("SET parquet_metadata_cache = true")
+
+
+def _register_db_file(db_file: str) -> str:
+    """
+    Expose the file as a view on the shared connection and return the view name.
+    The planner then sees a stable relation, and projection/filter pushdown into
+    the Parquet/CSV scan applies to every query made against it.
+    """
+    view_name = f"v_{hashlib.blake2b(db_file.encode(), digest_size=8).hexdigest()}"
+    escaped_path = db_file.replace("'", "''")
+    _CON.execute(f"CREATE VIEW IF NOT EXISTS {view_name} AS SELECT * FROM '{escaped_path}'")
+    return view_name
+
+
+def _json_default(value: Any) -> Any:
+    # orjson handles dates, datetimes and UUIDs natively; cover the remaining DuckDB types
+    if isinstance(value, Decimal):
+        return float(value)
+    return str(value)
+
+
+def _coerce_filter_value(value: Any) -> Any:
+    # Numbers and numeric strings are bound as numbers so they compare numerically
+    if isinstance(value, (bool, int, float)):
+        return value
+    if isinstance(value, str):
+        text = value.strip()
+        if text.lstrip("+-").isdigit():
+            return int(text)
+        try:
+            return float(text)
+        except ValueError:
+            return value
+    return str(value)
+
+
+def _records_json(result: duckdb.DuckDBPyConnection, indent: bool = False) -> str:
+    """
+    Serialize a query result as a JSON list of records straight from DuckDB's row
+    tuples, without materializing an intermediate DataFrame.
+    """
+    column_names = [column[0] for column in result.description]
+    records = [dict(zip(column_names, row)) for row in result.fetchall()]
+    option = orjson.OPT_INDENT_2 if indent else 0
+    return orjson.dumps(records, default=_json_default, option=option).decode()
+
 
 class UserParameters(BaseModel):
     """
@@ -54,9 +108,10 @@ def run_tool(config: UserParameters, args: ToolParameters) -> Any:
     Main tool logic: run SQL query against the file.
     """
     try:
+        view_name = _register_db_file(config.db_file)
+
         if args.describe:
-            result = duckdb.sql(f"DESCRIBE '{config.db_file}'").to_df()
-            return result.to_json(orient="records")
+            return _records_json(_CON.execute(f"DESCRIBE {view_name}"))
         
         # Map operation to SQL operator
         operation_map = {
@@ -70,52 +125,30 @@ def run_tool(config: UserParameters, args: ToolParameters) -> Any:
         }
         
         # Build SQL query
-        columns = args.column_names if args.column_names != '*' else '*'
-
-        # Handle contains operation specially
-        filter_clause_1 = None
-        if args.filter_operation_1:
-            assert args.filter_value_1 is not None, "Filter value is required for contains operation"
-            assert args.filter_column_1 is not None, "Filter column is required for contains operation"
-            try:
-                print("trying to parse filter_value as number")
-                float(args.filter_value_1)
-                filter_value = args.filter_value_1
-            except Exception as e:
-                print("Just using filter_value as string")
-                filter_value = f"'{args.filter_value_1}'"
-            filter_clause_1 = f"WHERE {args.filter_column_1} {operation_map[args.filter_operation_1]} {filter_value} "
-
-        filter_clause_2 = None
-        if args.filter_operation_2:
-            assert args.filter_value_2 is not None, "Filter value is required for contains operation"
-            assert args.filter_column_2 is not None, "Filter column is required for contains operation"
-            try:
-                print("trying to parse filter_value as number")
-                float(args.filter_value_2)
-                filter_value = args.filter_value_2
-            except Exception as e:
-                print("Just using filter_value as string")
-                filter_value = f"'{args.filter_value_2}'"
-            filter_clause_2 = f"AND {args.filter_column_2} {operation_map[args.filter_operation_2]} {filter_value} "
-
-        filter_clause_3 = None
-        if args.filter_operation_3:
-            assert args.filter_value_3 is not None, "Filter value is required for contains operation"
-            assert args.filter_column_3 is not None, "Filter column is required for contains operation"
-            try:
-                print("trying to parse filter_value as number")
-                float(args.filter_value_3)
-                filter_value = args.filter_value_3  
-            except Exception as e:
-                print("Just using filter_value as string")
-                filter_value = f"'{args.filter_value_3}'"
-            filter_clause_3 = f"AND {args.filter_column_3} {operation_map[args.filter_operation_3]} {filter_value}"
-
-        sql_query = f"SELECT {columns} FROM '{config.db_file}' " \
-            + (filter_clause_1 if filter_clause_1 else "") \
-            + (filter_clause_2 if filter_clause_2 else "") \
-            + (filter_clause_3 if filter_clause_3 else "")
+        # Only fall back to * when no columns were asked for, so specific column
+        # lists are projected down into the file scan
+        columns = args.column_names or '*'
+
+        # Filter values are bound as query parameters rather than spliced into the SQL
+        params = []
+
+        filters = [
+            (args.filter_column_1, args.filter_operation_1, args.filter_value_1),
+            (args.filter_column_2, args.filter_operation_2, args.filter_value_2),
+            (args.filter_column_3, args.filter_operation_3, args.filter_value_3),
+        ]
+        filter_clauses = []
+        for filter_column, filter_operation, filter_value in filters:
+            if not filter_operation:
+                continue
+            assert filter_value is not None, "Filter value is required for contains operation"
+            assert filter_column is not None, "Filter column is required for contains operation"
+            params.append(_coerce_filter_value(filter_value))
+            filter_clauses.append(f"{filter_column} {operation_map[filter_operation]} ?")
+
+        sql_query = f"SELECT {columns} FROM {view_name}"
+        if filter_clauses:
+            sql_query += " WHERE " + " AND ".join(filter_clauses)
 
         # Add optional clauses
         if args.group_by:
@@ -133,8 +166,7 @@ def run_tool(config: UserParameters, args: ToolParameters) -> Any:
         
         # Run SQL with DuckDB
         print(f"Running SQL query: {sql_query}")
-        result = duckdb.sql(sql_query).to_df()
-        return result.to_json(orient="records", indent=2)
+        return _records_json(_CON.execute(sql_query, params), indent=True)
     except Exception as e:
         return json.dumps({"error": str(e)}, indent=2)
 
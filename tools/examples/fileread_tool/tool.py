@@ -9,19 +9,14 @@ from pathlib import Path
 import sys
 import os
 import json
-import markdown
 import sqlite3
-import pytesseract
-import pandas as pd
-from PyPDF2 import PdfReader
-from docx import Document
-from PIL import Image
 from zipfile import ZipFile
-from bs4 import BeautifulSoup
-from striprtf.striprtf import rtf_to_text
 from pydantic import BaseModel as StudioBaseTool
 import argparse 
 
+# Format-specific libraries are imported inside the extractor that uses them, so
+# each call only pays the import cost of the one format it reads.
+
 # Our tool is stored in .../<workflow>/tools/<tool_name>/tool.py. So we need to go up 1 level to get to the root of the tool directory.
 ROOT_DIR = Path(__file__).parent
 sys.path.append(str(ROOT_DIR))
@@ -79,31 +74,46 @@ def extract_text_from_json(file_path: str) -> str:
 
 def extract_text_from_image(file_path: str) -> str:
     """Uses OCR to extract text from images."""
+    import pytesseract
+    from PIL import Image
     return pytesseract.image_to_string(Image.open(file_path))
 
 def extract_text_from_pdf(file_path: str) -> str:
-    """Extracts text from a PDF, falling back to OCR if necessary."""
-    text = ""
-    reader = PdfReader(file_path)
-    for page in reader.pages:
-        text += page.extract_text() or extract_text_from_image(file_path)
-    return text.strip() or "No readable text found in PDF."
+    """Extracts text from a PDF with PDFium, falling back to OCR if necessary."""
+    import pypdfium2 as pdfium
+    parts = []
+    pdf = pdfium.PdfDocument(file_path)
+    try:
+        for page in pdf:
+            textpage = page.get_textpage()
+            # PDFium separates lines with CRLF; keep plain newlines
+            parts.append(textpage.get_text_range().replace("\r\n", "\n") or extract_text_from_image(file_path))
+            textpage.close()
+            page.close()
+    finally:
+        pdf.close()
+    return "".join(parts).strip() or "No readable text found in PDF."
 
 def extract_text_from_docx(file_path: str) -> str:
     """Extracts text from Word (.docx) files."""
+    from docx import Document
     return "\n".join(para.text for para in Document(file_path).paragraphs)
 
 def extract_text_from_excel(file_path: str) -> str:
     """Extracts content from Excel files as CSV format."""
+    import pandas as pd
     return pd.read_excel(file_path).to_csv(index=False)
 
 def extract_text_from_html(file_path: str) -> str:
     """Extracts text content from an HTML file."""
+    from bs4 import BeautifulSoup
     with open(file_path, "r", encoding="utf-8") as file:
         return BeautifulSoup(file.read(), "html.parser").get_text()
 
 def extract_text_from_markdown(file_path: str) -> str:
     """Extracts plain text from a Markdown (.md) file."""
+    import markdown
+    from bs4 import BeautifulSoup
     with open(file_path, "r", encoding="utf-8") as file:
         md_content = file.read()
         html_content = markdown.markdown(md_content)  # Convert Markdown to HTML
@@ -125,6 +135,7 @@ def extract_text_from_sqlite(file_path: str) -> str:
 
 def extract_text_from_rtf(file_path: str) -> str:
     """Extracts text from an RTF file."""
+    from striprtf.striprtf import rtf_to_text
     with open(file_path, "r", encoding="utf-8") as file:
         return rtf_to_text(file.read())
 
@@ -15,6 +15,7 @@ import json
 import argparse 
 import numpy as np
 import pandas as pd
+import pyarrow.parquet as pq
 from scipy.optimize import minimize
 
 
@@ -35,9 +36,13 @@ def run_tool(
     stocks_ticker = args.stocks_ticker 
     amount = args.amount
 
-    time_series = pd.read_csv('/tmp/ts.csv')
-    time_series = time_series.loc[:,~time_series.columns.str.contains('^Unnamed')]
-    time_series = time_series.astype('int64') 
+    # Typed float price columns straight from the Parquet file written by the
+    # timeseries tool; the dates come back as the index rather than a data column.
+    # Only the requested tickers' column chunks are read. If none of them are in
+    # the file, every stored ticker is used as before.
+    available_tickers = set(pq.read_schema('/tmp/ts.parquet').names)
+    requested_tickers = [ticker for ticker in dict.fromkeys(stocks_ticker) if ticker in available_tickers]
+    time_series = pd.read_parquet('/tmp/ts.parquet', columns=requested_tickers or None)
     stocks_ticker =time_series.columns
     num_stocks = len(stocks_ticker)
     weights = 1.0 / num_stocks
@@ -52,16 +57,24 @@ def run_tool(
     }
     print(optimized_portfolio)
     
-    # Compute the backtest for the weight of the stock together
-    backtest = (time_series.pct_change() + 1).cumprod()
+    # Compute the backtest for the weight of the stock together. Cumulative growth
+    # is taken on the raw price array; the first row stays NaN as with pct_change().
+    # Missing ratios are skipped and left NaN, as DataFrame.cumprod() does, so a
+    # ticker with a shorter history still gets a backtest from its first price.
+    prices = time_series.to_numpy(dtype=np.float64)
+    ratios = prices[1:] / prices[:-1]
+    growth = np.full_like(prices, np.nan)
+    growth[1:] = np.where(np.isnan(ratios), np.nan, np.nancumprod(ratios, axis=0))
+    backtest = pd.DataFrame(growth, index=time_series.index, columns=time_series.columns)
 
     backtest = backtest.multiply(optimized_portfolio["recommended_allocation"], axis=1).multiply(amount)
     backtest.to_csv('/tmp/backtest-ts.csv', index=True)
     # optimized_portfolio["backtest"] = backtest
-    temp =backtest.sum(axis=1)
-    peak = temp.expanding(min_periods=1).max()
-    drawdown = (temp - peak) / peak
-    max_drawdown = drawdown.min()
+    temp = backtest.sum(axis=1).to_numpy()
+    peak = np.maximum.accumulate(temp)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        drawdown = (temp - peak) / peak
+    max_drawdown = float(np.nanmin(drawdown))
     optimized_portfolio["max_drawdown"] = max_drawdown
     # optimized_portfolio["1-yearbacktest"] = backtest.sum(axis=1).iloc[-1:]
     # print(optimized_portfolio["1-yearbacktest"] )
@@ -70,16 +83,28 @@ def run_tool(
 
 
 def mpt(ts: pd.DataFrame) -> np.ndarray:
-    # Use expectation variance to derive the weights of the portfolio
-    expected_returns = ts.pct_change().mean()
-    cov_matrix = ts.pct_change().cov()
+    # Use expectation variance to derive the weights of the portfolio. The moments
+    # are computed once, annualized up front, and held as plain arrays so each
+    # objective evaluation is a couple of BLAS calls. Means are per column and the
+    # covariance is pairwise-complete, as with pct_change().mean()/.cov(), so a
+    # ticker with a shorter history does not discard the other tickers' rows.
+    prices = ts.to_numpy(dtype=np.float64)
+    returns = pd.DataFrame(prices[1:] / prices[:-1] - 1.0)
+    expected_returns = returns.mean().to_numpy() * 252
+    cov_matrix = np.atleast_2d(returns.cov().to_numpy()) * 252
 
     # Define the function to minimize (negative Sharpe Ratio)
     def neg_sharpe_ratio(weights):
-        portfolio_return = np.sum(weights * expected_returns) * 252
-        portfolio_std_dev = np.sqrt(np.dot(weights.T, np.dot(cov_matrix, weights))) * np.sqrt(252)
-        sharpe_ratio = portfolio_return / portfolio_std_dev
-        return -sharpe_ratio
+        portfolio_return = expected_returns @ weights
+        portfolio_std_dev = np.sqrt(weights @ cov_matrix @ weights)
+        return -portfolio_return / portfolio_std_dev
+
+    # Analytic gradient, so SLSQP does not estimate it with n extra objective calls
+    def neg_sharpe_ratio_jac(weights):
+        cov_weights = cov_matrix @ weights
+        portfolio_return = expected_returns @ weights
+        portfolio_std_dev = np.sqrt(weights @ cov_weights)
+        return -expected_returns / portfolio_std_dev + portfolio_return * cov_weights / portfolio_std_dev**3
 
     # Define the constraints
     n = ts.shape[1]
@@ -88,7 +113,14 @@ def mpt(ts: pd.DataFrame) -> np.ndarray:
     bounds = tuple((0, 1) for x in range(n))
 
     # Minimize the negative Sharpe Ratio
-    result = minimize(neg_sharpe_ratio, weights_init, method='SLSQP', bounds=bounds, constraints=constraints)
+    result = minimize(
+        neg_sharpe_ratio,
+        weights_init,
+        method='SLSQP',
+        jac=neg_sharpe_ratio_jac,
+        bounds=bounds,
+        constraints=constraints,
+    )
 
     # Get the optimized weights
     optimized_weights = result.x
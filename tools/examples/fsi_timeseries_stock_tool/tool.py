@@ -30,32 +30,27 @@ def run_tool(
     config: UserParameters,
     args: ToolParameters,
 ):
-    tickers_list = args.tickers_list
-    
-    all_time_series = {}
-    all_time_series_status = {}
-    # Get stock data for each ticker
-    for ticker in tickers_list:
-        stock = yf.Ticker(ticker)
-        hist = stock.history(period="3y")
-        # Extract dates and closing prices
-        if not hist.empty:
-            dates = hist.index.strftime('%Y-%m-%d').tolist()
-            prices = hist['Close'].tolist()
-            
-            # Convert to DataFrame with date as index and prices as columns
-            df = pd.DataFrame(prices, index=dates, columns=[ticker])
-            
-            # Merge with existing DataFrame
-            if 'all_time_series_df' in locals():
-                all_time_series_df = all_time_series_df.merge(df, how='outer', left_index=True, right_index=True)
-            else:
-                all_time_series_df = df
-            all_time_series_status[ticker] = "Data Lookup complete"
-        else:
-            all_time_series_status[ticker] = "No history found"
-    all_time_series_df.index = pd.to_datetime(all_time_series_df.index)
-    all_time_series_df.to_csv('/tmp/ts.csv', index=True)
+    tickers_list = list(dict.fromkeys(args.tickers_list))
+
+    # Fetch all tickers in one batched download rather than one request per ticker.
+    # auto_adjust matches the adjusted closes that Ticker.history() returns.
+    data = yf.download(tickers_list, period="3y", auto_adjust=True, threads=True, progress=False)
+    close = data["Close"]
+    if isinstance(close, pd.Series):
+        close = close.to_frame(tickers_list[0])
+    close = close.reindex(columns=tickers_list)
+
+    has_history = close.notna().any(axis=0)
+    all_time_series_status = {
+        ticker: "Data Lookup complete" if has_history[ticker] else "No history found"
+        for ticker in tickers_list
+    }
+
+    # Keep only tickers and dates with data, indexed by plain (unnamed) dates
+    all_time_series_df = close.loc[:, has_history].dropna(how="all")
+    all_time_series_df.index = pd.to_datetime(all_time_series_df.index.strftime('%Y-%m-%d')).rename(None)
+    all_time_series_df.columns.name = None
+    all_time_series_df.to_parquet('/tmp/ts.parquet', index=True)
     return  all_time_series_status
 
 
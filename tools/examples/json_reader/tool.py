@@ -5,6 +5,7 @@ A simple JSON reader tool that can read JSON files from a given path, relative t
 from pydantic import BaseModel, Field
 from typing import Optional, Any
 import json 
+import orjson
 import argparse
 from pathlib import Path
 import sys 
@@ -35,8 +36,15 @@ def run_tool(config: UserParameters, args: ToolParameters) -> Any:
     """
     
     filepath = args.filepath
-    data = json.load(open(filepath))
-    return json.dumps(data, indent=2)
+    with open(filepath, "rb") as f:
+        raw = f.read()
+    try:
+        data = orjson.loads(raw)
+    except orjson.JSONDecodeError:
+        # orjson rejects the NaN/Infinity literals the json module accepts; read and
+        # write those files with json instead (malformed files still raise here)
+        return json.dumps(json.loads(raw), indent=2)
+    return orjson.dumps(data, option=orjson.OPT_INDENT_2).decode()
 
 
 
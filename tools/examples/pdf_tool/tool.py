@@ -44,13 +44,31 @@ from textwrap import dedent
 from typing import Literal, Optional, List, Type
 from pydantic import BaseModel, Field
 from pydantic import BaseModel as StudioBaseTool
-import PyPDF2
+import pypdfium2 as pdfium
 from pathlib import Path
 from markdown import markdown
+try:
+    # CommonMark C implementation, used for plain Markdown when available
+    import cmarkgfm
+except ImportError:
+    cmarkgfm = None
 from weasyprint import HTML, CSS
+from weasyprint.text.fonts import FontConfiguration
+import functools
 import json 
 import argparse 
 
+# Font discovery is the dominant fixed cost of a WeasyPrint render, so one font
+# configuration is shared by every conversion made by this process.
+_FONT_CONFIG = FontConfiguration()
+
+
+@functools.lru_cache(maxsize=32)
+def _load_css(path: str, mtime: float) -> CSS:
+    # Keyed on mtime as well as path so an edited stylesheet is re-parsed
+    return CSS(filename=path, font_config=_FONT_CONFIG)
+
+
 class UserParameters(BaseModel):
     pass
 
@@ -85,13 +103,19 @@ def run_tool(
             if not pdf_path.exists():
                 raise FileNotFoundError(f"PDF file not found: {pdf_path}")
 
-            # Extract text from the PDF
-            with pdf_path.open("rb") as pdf_file:
-                pdf_reader = PyPDF2.PdfReader(pdf_file)
-                text_content = ""
-                for page in pdf_reader.pages:
-                    text_content += page.extract_text() + "\n"
-            return text_content.strip()
+            # Extract text from the PDF with PDFium, collecting pages and joining once
+            pdf_document = pdfium.PdfDocument(pdf_path)
+            try:
+                page_texts = []
+                for page in pdf_document:
+                    textpage = page.get_textpage()
+                    # PDFium separates lines with CRLF; keep the plain newlines callers got before
+                    page_texts.append(textpage.get_text_bounded().replace("\r\n", "\n"))
+                    textpage.close()
+                    page.close()
+            finally:
+                pdf_document.close()
+            return "\n".join(page_texts).strip()
 
         elif action == "markdown_to_pdf":
             # Validate the output PDF file path
@@ -116,17 +140,21 @@ def run_tool(
             if not raw_content or not raw_content.strip():
                 raise ValueError("Input Markdown content is empty or invalid.")
 
-            # Convert Markdown to HTML
-            raw_html = markdown(raw_content, extensions=extras or [])
+            # Convert Markdown to HTML. Python-Markdown is only needed when extensions are requested.
+            # CMARK_OPT_UNSAFE passes raw HTML and link URLs through, as Python-Markdown does.
+            if cmarkgfm is not None and not extras:
+                raw_html = cmarkgfm.markdown_to_html(raw_content, options=cmarkgfm.cmark.Options.CMARK_OPT_UNSAFE)
+            else:
+                raw_html = markdown(raw_content, extensions=extras or [])
 
             # Create WeasyPrint HTML object
             html = HTML(string=raw_html, base_url=str(base_path))
 
             # Apply CSS styling if provided
-            styles = [CSS(filename=str(css_path))] if css_path else []
+            styles = [_load_css(str(css_path), css_path.stat().st_mtime)] if css_path else []
 
             # Generate PDF from the HTML
-            html.write_pdf(pdf_path, stylesheets=styles)
+            html.write_pdf(pdf_path, stylesheets=styles, font_config=_FONT_CONFIG)
             return f"PDF successfully generated at {pdf_path}"
 
         else:
@@ -9,7 +9,8 @@ import json
 import argparse
 import os
 from pathlib import Path
-import pdfplumber
+import pypdfium2 as pdfium
+import re
 import sys
 
 # Our tool is stored in .../<workflow>/tools/<tool_name>/tool.py. So we need to go up 3 levels to get to the root of the workflow.
@@ -17,6 +18,9 @@ ROOT_DIR = Path(__file__).parent.parent.parent
 sys.path.append(str(ROOT_DIR))
 os.chdir(ROOT_DIR)
 
+# Matches a (stripped) line of ten or more words without building a word list
+_TEN_OR_MORE_WORDS = re.compile(r"(?:\S+\s+){9}\S")
+
 
 class UserParameters(BaseModel):
     pass
@@ -26,6 +30,25 @@ class ToolParameters(BaseModel):
     input_file: str = Field(description="The workflow-relative local path to the PDF file to read. example: 'report.pdf'")
 
 
+def _extract_page_texts(pdf_path: Path) -> list:
+    """
+    Extract the text of every page with PDFium (C++), which is far faster than the
+    pure-Python pdfminer stack behind pdfplumber. Pages are read sequentially: a
+    PDFium document must not be used from several threads at once.
+    """
+    pdf = pdfium.PdfDocument(pdf_path)
+    try:
+        texts = []
+        for page in pdf:
+            textpage = page.get_textpage()
+            texts.append(textpage.get_text_bounded())
+            textpage.close()
+            page.close()
+        return texts
+    finally:
+        pdf.close()
+
+
 def run_tool(config: UserParameters, args: ToolParameters) -> Any:
     pdf_path = Path(args.input_file)
     if not pdf_path.exists():
@@ -33,25 +56,23 @@ def run_tool(config: UserParameters, args: ToolParameters) -> Any:
 
     markdown_lines = []
 
-    with pdfplumber.open(pdf_path) as doc:
-        for i, page in enumerate(doc.pages):
-            text = page.extract_text() or ""
-            lines = text.splitlines()
-
-            for line in lines:
-                line = line.strip()
-                if not line:
-                    continue
-
-                # Simple formatting guesses
-                if line.isupper() and len(line.split()) < 10:
-                    markdown_lines.append(f"## {line}")  # Heading
-                elif line.endswith(":"):
-                    markdown_lines.append(f"**{line}**")
-                else:
-                    markdown_lines.append(line)
-
-            markdown_lines.append("\n---\n")  # Page break separator
+    for text in _extract_page_texts(pdf_path):
+        lines = text.splitlines()
+
+        for line in lines:
+            line = line.strip()
+            if not line:
+                continue
+
+            # Simple formatting guesses
+            if line.isupper() and not _TEN_OR_MORE_WORDS.match(line):
+                markdown_lines.append(f"## {line}")  # Heading
+            elif line.endswith(":"):
+                markdown_lines.append(f"**{line}**")
+            else:
+                markdown_lines.append(line)
+
+        markdown_lines.append("\n---\n")  # Page break separator
 
     markdown = "\n\n".join(markdown_lines)
     return {
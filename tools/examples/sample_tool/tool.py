@@ -7,7 +7,7 @@ employed agent frameork supports tool descriptions.
 
 from pydantic import BaseModel, Field
 from typing import Optional, Any
-import json 
+import json
 import argparse
 
 
@@ -70,15 +70,17 @@ if __name__ == "__main__":
     parser = argparse.ArgumentParser()
     parser.add_argument("--user-params", required=True, help="Tool configuration")
     parser.add_argument("--tool-params", required=True, help="Tool arguments")
+    parser.add_argument("--trusted", action="store_true", help="Skip validation of pre-validated parameters from a trusted caller")
     args = parser.parse_args()
     
-    # Parse JSON into dictionaries
-    user_dict = json.loads(args.user_params)
-    tool_dict = json.loads(args.tool_params)
-    
-    # Validate dictionaries against Pydantic models
-    config = UserParameters(**user_dict)
-    params = ToolParameters(**tool_dict)
+    if args.trusted:
+        # Caller guarantees the JSON already matches the models; skip validation
+        config = UserParameters.model_construct(**json.loads(args.user_params))
+        params = ToolParameters.model_construct(**json.loads(args.tool_params))
+    else:
+        # Parse and validate the JSON arguments against the Pydantic models in one pass
+        config = UserParameters.model_validate_json(args.user_params)
+        params = ToolParameters.model_validate_json(args.tool_params)
     
     # Run the tool.
     output = run_tool(config, params)
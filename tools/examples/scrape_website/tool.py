@@ -1,52 +1,147 @@
 """
-Fetches and returns the main text content of a website using BeautifulSoup.
-:param url: The URL of the website to scrape.
-:return: The raw text content as a string.
+Fetches and returns the main text content of a website using lxml.
+:param url: The URL of the website to scrape, or a list of URLs to scrape in parallel.
+:return: The raw text content as a string, or a mapping of URL to text content.
 """
         
         
-from typing import Type
+from typing import Type, Optional, List
 from pydantic import BaseModel, Field
 from pydantic import BaseModel as StudioBaseTool
 from textwrap import dedent
-import json 
+import codecs
+import json
 import argparse
+from concurrent.futures import ThreadPoolExecutor
 
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from lxml import etree
+
+# Shared across invocations so repeated fetches from the same host reuse pooled
+# keep-alive connections instead of paying a new TCP/TLS handshake each time.
+_SESSION = requests.Session()
+_SESSION.headers.update({
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 '
+                  '(KHTML, like Gecko) Chrome/96.0.4664.110 Safari/537.36'
+})
+_ADAPTER = HTTPAdapter(
+    pool_connections=10,
+    pool_maxsize=50,
+    max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[502, 503, 504]),
+)
+_SESSION.mount("https://", _ADAPTER)
+_SESSION.mount("http://", _ADAPTER)
+
+# Elements whose text is never part of the visible page content (noscript
+# fallbacks only render with JavaScript disabled).
+_SKIP_TAGS = {"script", "style", "template", "noscript"}
+
+
+class _TextTarget:
+    """
+    lxml parser target that collects visible text strings as they are parsed,
+    so the page is never held as a full document tree.
+    """
+
+    def __init__(self):
+        self.texts = []
+        self._buffer = []
+        self._skip_depth = 0
+
+    def _flush(self):
+        if self._buffer:
+            text = "".join(self._buffer).strip()
+            if text:
+                self.texts.append(text)
+            self._buffer = []
+
+    def start(self, tag, attrib):
+        self._flush()
+        if tag in _SKIP_TAGS:
+            self._skip_depth += 1
+
+    def end(self, tag):
+        self._flush()
+        if tag in _SKIP_TAGS and self._skip_depth:
+            self._skip_depth -= 1
+
+    def data(self, data):
+        if not self._skip_depth:
+            self._buffer.append(data)
+
+    def close(self):
+        self._flush()
+
 
 class UserParameters(BaseModel):
     pass
 
 class ToolParameters(BaseModel):
-    website: str = Field(description="The website URL to search or fetch data from")
+    website: Optional[str] = Field(default=None, description="The website URL to search or fetch data from")
+    websites: Optional[List[str]] = Field(default=None, description="Several website URLs to fetch in parallel, instead of a single website")
 
-def run_tool(
-    config: UserParameters,
-    args: ToolParameters,
-):
-    website = args.website
-    
-    headers = {
-        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 '
-                    '(KHTML, like Gecko) Chrome/96.0.4664.110 Safari/537.36'
-    }
+def make_parser(target: _TextTarget, response: requests.Response) -> etree.HTMLParser:
+    """
+    Build an HTML parser for the response's charset. Without a declared
+    charset, lxml detects the encoding from the page itself.
+    """
+    if "charset" not in response.headers.get("Content-Type", ""):
+        return etree.HTMLParser(target=target)
     
     try:
-        # Send a GET request to fetch the HTML content
-        response = requests.get(website, headers=headers)
-        response.raise_for_status()  # Ensure we catch HTTP errors
+        encoding = codecs.lookup(response.encoding).name
+    except LookupError:
+        # Unknown or misspelled charset: guess it from the body, as response.text
+        # would (this reads the whole body up front)
+        encoding = response.apparent_encoding
+    try:
+        return etree.HTMLParser(target=target, encoding=encoding)
+    except LookupError:
+        return etree.HTMLParser(target=target)
+
+
+def scrape(website: str) -> str:
+    """
+    Fetch one website and return its text content, or an error message.
+    """
+    try:
+        # Stream the HTML content and extract text while it downloads
+        with _SESSION.get(website, stream=True, timeout=30) as response:
+            response.raise_for_status()  # Ensure we catch HTTP errors
+
+            target = _TextTarget()
+            parser = make_parser(target, response)
+            for chunk in response.iter_content(chunk_size=64 * 1024):
+                parser.feed(chunk)
+            try:
+                parser.close()
+            except etree.XMLSyntaxError:
+                # Empty or unparseable document: keep whatever text was collected
+                target.close()
+            content = "\n".join(target.texts)
 
-        # Parse the HTML content
-        soup = BeautifulSoup(response.text, 'html.parser')
-        
-        # Extract text content from the page (e.g., from <p> tags)
-        content = soup.get_text(separator="\n", strip=True)
-        
         return content
 
     except requests.exceptions.RequestException as e:
         return f"An error occurred while scraping: {e}"
+
+
+def run_tool(
+    config: UserParameters,
+    args: ToolParameters,
+):
+    if args.websites:
+        # Fetch concurrently over the shared session; the work is network-bound
+        urls = list(dict.fromkeys(args.websites))
+        with ThreadPoolExecutor(max_workers=min(16, len(urls))) as executor:
+            return dict(zip(urls, executor.map(scrape, urls)))
+
+    if not args.website:
+        return "An error occurred while scraping: either website or websites must be provided"
+
+    return scrape(args.website)
     
     
 
@@ -57,18 +152,23 @@ if __name__ == "__main__":
     parser = argparse.ArgumentParser()
     parser.add_argument("--user-params", required=True, help="JSON string for tool configuration")
     parser.add_argument("--tool-params", required=True, help="JSON string for tool arguments")
+    parser.add_argument("--trusted", action="store_true", help="Skip validation of pre-validated parameters from a trusted caller")
     args = parser.parse_args()
     
-    # Parse JSON into dictionaries
-    config_dict = json.loads(args.user_params)
-    params_dict = json.loads(args.tool_params)
-    
-    # Validate dictionaries against Pydantic models
-    config = UserParameters(**config_dict)
-    params = ToolParameters(**params_dict)
+    if args.trusted:
+        # Caller guarantees the JSON already matches the models; skip validation
+        config = UserParameters.model_construct(**json.loads(args.user_params))
+        params = ToolParameters.model_construct(**json.loads(args.tool_params))
+    else:
+        # Parse and validate the JSON arguments against the Pydantic models in one pass
+        config = UserParameters.model_validate_json(args.user_params)
+        params = ToolParameters.model_validate_json(args.tool_params)
 
     output = run_tool(
         config,
         params
     )
+    if isinstance(output, dict):
+        # Per-URL results from 'websites' are emitted as JSON for the caller to parse
+        output = json.dumps(output)
     print(OUTPUT_KEY, output)
\ No newline at end of file